@@ -46,9 +46,11 @@ class DBConnector(object):
             return conn
         return apply()
 
-    def execute(self, query):
+    def execute(self, query, stream_results=False):
         """
         :param query: SQL query to be executed
+        :param stream_results: if True execute the query with a server side cursor so rows are sent by the database as
+        they are fetched instead of being buffered in memory all at once. use with fetch_batches
         :return: sqlalchemy.engine.result.ResultProxy object
         """
         @try_except(self.logger)
@@ -57,7 +59,11 @@ class DBConnector(object):
                 query_ = text(query)
             else:
                 query_ = query
-            response = self.conn.execute(query_)
+            if stream_results is True:
+                conn = self.conn.execution_options(stream_results=True)
+            else:
+                conn = self.conn
+            response = conn.execute(query_)
             return response
 
         if self.conn is not None:
@@ -73,6 +79,26 @@ class DBConnector(object):
         query_result = response.fetchall()
         return query_result
 
+    def fetch_one(self, response):
+        """
+        :param response: sqlalchemy.engine.result.ResultProxy object
+        :return: tuple of the first row from the query result or None if the query returned no rows
+        """
+        query_result = response.fetchone()
+        return query_result
+
+    def fetch_batches(self, response, batch_size=10000):
+        """
+        :param response: sqlalchemy.engine.result.ResultProxy object
+        :param batch_size: number of rows fetched from the cursor at a time
+        :return: generator of lists of tuples where each list holds at most `batch_size` rows from the query result
+        """
+        while True:
+            query_result = response.fetchmany(batch_size)
+            if not query_result:
+                break
+            yield query_result
+
 
 class PostgresConnector(DBConnector):
     def __init__(self, user, password, host, dbname, port, logger=None):
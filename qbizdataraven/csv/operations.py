@@ -7,11 +7,21 @@ def get_csv_document(path, delimiter=',', fieldnames=None):
     :param delimiter: separator used in csv file
     :return: list of tuples where each tuple is a row in csv file
     """
+    dataset = list(stream_csv_document(path, delimiter=delimiter, fieldnames=fieldnames))
+    return dataset
+
+
+def stream_csv_document(path, delimiter=',', fieldnames=None):
+    """
+    :param path: path to csv file
+    :param delimiter: separator used in csv file
+    :param fieldnames: sequence of column names to be used when no headers exist in file
+    :return: generator of dicts where each dict is a row in csv file. rows are read lazily so that only one row is held
+    in memory at a time
+    """
     with open(path, 'r') as infile:
         csvreader = csv.DictReader(infile, delimiter=delimiter, fieldnames=fieldnames)
-        dataset = list(csvreader)
-    infile.close()
-    return dataset
+        yield from csvreader
 
 
 def apply_reducer(dataset, reducer, *columns, **kwargs):
@@ -1,3 +1,5 @@
+# values treated as null by measure_null; shared across rows rather than rebuilt per call
+NULL_VALUES = frozenset({"NULL"})
 
 
 def measure_null(row, *columns, null_values=None):
@@ -7,17 +9,11 @@ def measure_null(row, *columns, null_values=None):
     :param null_values:
     :return:
     """
-    null_values_ = {"NULL"}
+    null_values_ = NULL_VALUES
     if null_values is not None:
         null_values_ = null_values_.union(null_values)
 
-    result = {}
-    for column in columns:
-        value = row[column]
-        if value in null_values_:
-            result[column] = 1
-        else:
-            result[column] = 0
+    result = {column: int(row[column] in null_values_) for column in columns}
     output = {"result": result}
     return output
 
@@ -31,13 +27,13 @@ def measure_duplicates(row, *columns, collection=None):
     """
     result = {}
     if collection is None:
-        collection = {}
+        collection = set()
 
     for column in columns:
         value = row[column]
         key = (column, value)
         if key not in collection:
-            collection[key] = None
+            collection.add(key)
             result[column] = 0
         else:
             result[column] = 1
@@ -54,14 +50,14 @@ def measure_set_duplicates(row, *columns, collection=None):
     :return:
     """
     if collection is None:
-        collection = {}
+        collection = set()
 
-    values = tuple(map(lambda col: row[col], columns))
-    key = tuple(zip(columns, values))
+    # the column names are the same for every row so only the values are needed to identify a set
+    key = tuple([row[col] for col in columns])
 
     columns_label = ",".join(columns)
     if key not in collection:
-        collection[key] = None
+        collection.add(key)
         result = {columns_label: 0}
     else:
         result = {columns_label: 1}
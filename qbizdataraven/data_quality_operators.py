@@ -1,10 +1,11 @@
 import abc
 
 from .log import get_null_logger
-from .tests import CustomTestFactory, SQLNullTest, SQLDuplicateTest, SQLSetDuplicateTest, CSVNullTest, \
-    CSVDuplicateTest, CSVSetDuplicateTest
+from .tests import CustomTestFactory, SQLNullTest, SQLDuplicateTest, SQLSetDuplicateTest, SQLNullDuplicateTest, \
+    CSVNullTest, CSVDuplicateTest, CSVSetDuplicateTest
 
-from .operations import SQLOperations, SQLSetOperations, CSVOperations, CSVSetOperations, CustomSQLOperations
+from .operations import SQLOperations, SQLSetOperations, SQLCompositeOperations, CSVOperations, CSVSetOperations, \
+    CustomSQLOperations
 
 
 class DQOperator(object):
@@ -158,6 +159,47 @@ class SQLSetDuplicateCheckOperator(SQLDQOperator):
         return test_results
 
 
+class SQLNullDuplicateCheckOperator(SQLDQOperator):
+    def __init__(
+            self,
+            conn,
+            from_,
+            threshold,
+            *columns,
+            logger=None,
+            where=None,
+            hard_fail=None,
+            use_ansi=True
+    ):
+        """
+        Runs the null and duplicate checks for every column with a single scan of the table. Test results are keyed by
+        `{column}_null` and `{column}_duplicate`.
+        :param conn: Database connection object
+        :param from_: Schema and table name of table to be tested
+        :param threshold: Numeric or dict keyed by `{column}_null` and `{column}_duplicate` to specify the threshold for
+        a given test or collection of tests
+        :param columns: The column names entered as comma separated positional arguments
+        :param logger: Optional logging function. If None is passed then logged messages will be swallowed
+        :param where: Conditional logic to be applied to table specified in `from_`
+        :param hard_fail: Boolean or dict keyed by `{column}_null` and `{column}_duplicate` to specify if test failure
+        should result in terminating the current process
+        :param use_ansi: Boolean to specify if SQL query should be complied to ANSI standards
+        """
+        super().__init__(conn, from_, threshold, *columns, logger=logger, where=where, hard_fail=hard_fail,
+                         use_ansi=use_ansi)
+
+    def build_test(self):
+        test = SQLNullDuplicateTest(self.dialect, self.from_, self.threshold, *self.columns, where=self.where,
+                                    hard_fail=self.hard_fail, use_ansi=self.use_ansi).factory()
+        return test
+
+    def execute(self):
+        test = self.build_test()
+        operator = SQLCompositeOperations(self.conn, self.logger, test)
+        test_results = operator.execute()
+        return test_results
+
+
 class CSVDQOperator(DQOperator):
     def __init__(
             self,
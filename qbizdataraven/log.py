@@ -2,7 +2,9 @@ import logging
 
 
 def get_null_logger():
-    handler = logging.NullHandler()
     logger = logging.getLogger()
-    logger.addHandler(handler)
+    # only attach one NullHandler no matter how many operators request the null logger
+    if not any(isinstance(handler, logging.NullHandler) for handler in logger.handlers):
+        handler = logging.NullHandler()
+        logger.addHandler(handler)
     return logger
\ No newline at end of file
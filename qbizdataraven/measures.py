@@ -3,11 +3,20 @@ import abc
 from sqlalchemy.sql import func, distinct
 
 from .sql.helpers import compile_to_dialect
-from .sql.measure_logic import measure_proportion_each_column, measure_set_duplication
+from .sql.measure_logic import measure_proportion_each_column, measure_proportions_each_column, \
+    measure_set_duplication
 
 from .csv.reducers import measure_null, measure_duplicates, measure_set_duplicates
 
 
+def count_distinct(column):
+    """
+    :param column: column to be aggregated
+    :return: sqlalchemy count distinct aggregate of column
+    """
+    return func.count(distinct(column))
+
+
 class Measure(object):
     pass
 
@@ -26,6 +35,19 @@ class SQLMeasure(Measure):
         self.dialect = dialect
 
 
+class SQLCompositeMeasure(SQLMeasure):
+    def __init__(self, dialect, from_, query, measure_names, *columns):
+        """
+        :param dialect: The SQL dialect for the given database
+        :param from_: Schema and table name of table to be tested
+        :param query: The SQL query used to calculate every measure value
+        :param measure_names: Names of the measures calculated for each column by `query`
+        :param columns: The column names entered as comma separated positional arguments
+        """
+        super().__init__(dialect, from_, query, *columns)
+        self.measure_names = measure_names
+
+
 class CSVMeasure(Measure):
     def __init__(self, delimiter, from_, reducer, *columns):
         """
@@ -102,12 +124,9 @@ class SQLDuplicateMeasure(SQLMeasureFactory):
         super().__init__(dialect, from_, *columns, where=where, use_ansi=use_ansi)
 
     def build_measure_query(self):
-        def aggregate_func(column):
-            return func.count(distinct(column))
-
         measure_query = measure_proportion_each_column(
             self.from_,
-            aggregate_func,
+            count_distinct,
             *self.columns,
             where_clause=self.where
         )
@@ -123,6 +142,32 @@ class SQLSetDuplicateMeasure(SQLMeasureFactory):
         return measure_query
 
 
+class SQLNullDuplicateMeasure(SQLMeasureFactory):
+    def __init__(self, dialect, from_, *columns, where=None, use_ansi=True):
+        super().__init__(dialect, from_, *columns, where=where, use_ansi=use_ansi)
+
+    @staticmethod
+    def build_aggregate_funcs():
+        aggregate_funcs = {"null": func.count, "duplicate": count_distinct}
+        return aggregate_funcs
+
+    def build_measure_query(self):
+        aggregate_funcs = self.build_aggregate_funcs()
+        measure_query = measure_proportions_each_column(
+            self.from_,
+            aggregate_funcs,
+            *self.columns,
+            where_clause=self.where
+        )
+        return measure_query
+
+    def factory(self):
+        query = self.build_measure_query()
+        query_ = self.compile_dialect(query, self.dialect, self.use_ansi)
+        measure_names = tuple(self.build_aggregate_funcs())
+        return SQLCompositeMeasure(self.dialect, self.from_, query_, measure_names, *self.columns)
+
+
 class CSVMeasureFactory(MeasureFactory):
     def __init__(self, from_, *columns, delimiter=','):
         """
@@ -3,8 +3,10 @@ import abc
 from .exception_handling import TestFailure
 from .common import test_reuslt_msg_template, hard_fail_msg_template
 
-from .sql.operations import FetchQueryResults
-from .csv.operations import get_csv_document, apply_reducer
+from .sql.helpers import union_labeled_queries
+from .sql.measure_logic import format_measure_label
+from .sql.operations import FetchQueryResults, FetchLabeledQueryResults
+from .csv.operations import stream_csv_document, apply_reducer
 
 
 class Operations(object):
@@ -175,6 +177,31 @@ class SQLSetOperations(SQLOperations):
         return descriptions
 
 
+class SQLCompositeOperations(SQLOperations):
+    def __init__(self, conn, logger, test):
+        super().__init__(conn, logger, test)
+
+    def format_test_description(self, **description_kwargs):
+        descriptions = {}
+        description_template = self.test.description
+        threshold = self.test.threshold
+        measure = self.test.measure
+        columns = measure.columns
+        measure_names = measure.measure_names
+        from_ = measure.from_
+        description_kwargs["from_"] = from_
+        for column in columns:
+            for measure_name in measure_names:
+                label = format_measure_label(column, measure_name)
+                threshold_ = self.parse_dict_param(threshold, label)
+                description_kwargs["threshold"] = threshold_
+                description_kwargs["column"] = column
+                description_kwargs["measure"] = measure_name
+                description = description_template.format(**description_kwargs)
+                descriptions[label] = description
+        return descriptions
+
+
 class CSVOperations(Operations):
     def __init__(self, logger, test, fieldnames=None, **reducer_kwargs):
         """
@@ -209,7 +236,7 @@ class CSVOperations(Operations):
         path = measure.from_
         reducer = measure.reducer
         columns = measure.columns
-        document = get_csv_document(path, delimiter=delimiter, fieldnames=self.fieldnames)
+        document = stream_csv_document(path, delimiter=delimiter, fieldnames=self.fieldnames)
         reducer_results = apply_reducer(document, reducer, *columns, **self.reducer_kwargs)
         measure_values = self.build_measure_proportion_values(reducer_results)
         return measure_values
@@ -257,6 +284,8 @@ class CSVSetOperations(CSVOperations):
 
 
 class CustomSQLOperations(Operations):
+    label_column = "dataraven_column_label"
+
     def __init__(self, conn, logger, test, **test_desc_kwargs):
         """
         :param conn: Database connection object
@@ -302,10 +331,19 @@ class CustomSQLOperations(Operations):
         threshold = self.test.threshold
 
         if columns:
+            # run the test for every column in a single round trip
+            column_queries = []
             for column in columns:
                 threshold_ = self.parse_dict_param(threshold, column)
                 query_ = query.format(column=column, threshold=threshold_)
-                test_outcome = FetchQueryResults(self.conn, query_).get_results()
+                column_queries.append((column, query_))
+            label_column = self.label_column
+            batch_query = union_labeled_queries(column_queries, label_column)
+            batch_outcomes = FetchLabeledQueryResults(self.conn, batch_query, label_column).get_results()
+            for column in columns:
+                test_outcome = batch_outcomes.get(column)
+                if test_outcome is None:
+                    raise ValueError(f"expected query for column {column} to return at least one row but found none.")
                 test_outcomes[column] = format_test_outcome(test_outcome)
         else:
             test_outcome = FetchQueryResults(self.conn, query).get_results()
@@ -38,14 +38,19 @@ def build_aggregate_query(from_clause, *groupby_columns, where_clause=None, **ag
     :param groupby_columns: column names to be used in group by clause; expected str, TextClause or ColumnClause
     :param where_clause: predicate to apply to where clause in query; expected str, TextClause, BinaryExpression
     :param aggregate_columns: key value pairs of the form column_name=func where column_name is the name of table
-    column and func is an aggregate function from sqlalchemy.sql.func
+    column and func is an aggregate function from sqlalchemy.sql.func. to aggregate a column under a different label
+    use label=(column_name, func)
     :return: sqlalchemy.sql.selectable.Select object
     """
     from_clause_ = format_from_clause(from_clause)
     aggregates = []
     for col in aggregate_columns:
-        col_ = text(col)
         func = aggregate_columns[col]
+        if isinstance(func, tuple):
+            source_col, func = func
+        else:
+            source_col = col
+        col_ = text(source_col)
         agg_column_label = col
         agg_column = func(col_).label(agg_column_label)
         aggregates.append(agg_column)
@@ -1,3 +1,6 @@
+import re
+from functools import lru_cache
+
 from sqlalchemy.dialects.postgresql import dialect as PostgresDialect
 from sqlalchemy.dialects.mysql import dialect as MySQLDialect
 from sqlalchemy import text, column
@@ -5,6 +8,28 @@ from sqlalchemy.sql.elements import TextClause, ColumnClause
 from sqlalchemy.sql.selectable import Select, Alias, Join
 
 
+# statement terminator followed only by whitespace and trailing -- or /* */ comments
+_TRAILING_SEMICOLON = re.compile(r";((?:\s*(?:--[^\n]*|/\*.*?\*/))*\s*)$", re.S)
+
+
+@lru_cache(maxsize=256)
+def text_clause(text_):
+    """
+    :param text_: SQL text
+    :return: sqlalchemy TextClause object. clauses are cached so repeated text is only parsed by sqlalchemy once
+    """
+    return text(text_)
+
+
+@lru_cache(maxsize=256)
+def column_clause(name):
+    """
+    :param name: column name
+    :return: sqlalchemy ColumnClause object. clauses are cached so each column name is only built once
+    """
+    return column(name)
+
+
 def apply_where_clause(query, where_clause):
     """
     :param query: sqlalchemy.sql.selectable.Select object
@@ -12,7 +37,7 @@ def apply_where_clause(query, where_clause):
     :return: query with where clause logic added
     """
     if isinstance(where_clause, str):
-        where_clause_ = text(where_clause)
+        where_clause_ = text_clause(where_clause)
         query_ = query.where(where_clause_)
         return query_
     else:
@@ -36,7 +61,7 @@ def format_from_clause(from_clause):
     condition = any(map(lambda class_: isinstance(from_clause, class_), expected_sqlalchemy_classes))
 
     if isinstance(from_clause, str):
-        return text(from_clause)
+        return text_clause(from_clause)
     elif condition is True:
         return from_clause
     else:
@@ -55,9 +80,9 @@ def format_select_columns(*columns):
     output = []
     for col in columns:
         if isinstance(col, str):
-            output.append(column(col))
+            output.append(column_clause(col))
         elif isinstance(col, TextClause):
-            output.append(column(str(col)))
+            output.append(column_clause(str(col)))
         elif isinstance(col, ColumnClause):
             output.append(col)
         else:
@@ -85,6 +110,18 @@ def compile_to_dialect(query, dialect, use_ansi=True):
     return query_
 
 
-
-
-
+def union_labeled_queries(labeled_queries, label_column):
+    """
+    :param labeled_queries: sequence of (label, query) pairs where each query is a SQL select statement
+    :param label_column: name of the column used to hold the label of each query in the combined result
+    :return: str of a single query returning the rows of every query, tagged with its label, combined by UNION ALL
+    """
+    selects = []
+    for i, (label, query) in enumerate(labeled_queries):
+        label_ = str(label).replace("'", "''")
+        query_ = _TRAILING_SEMICOLON.sub(r"\1", query.strip()).strip()
+        alias = f"q{i}"
+        # keep the query on its own lines so a trailing line comment can't swallow the closing parenthesis
+        selects.append(f"select '{label_}' as {label_column}, {alias}.* from (\n{query_}\n) {alias}")
+    union_query = "\nunion all\n".join(selects)
+    return union_query
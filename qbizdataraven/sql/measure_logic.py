@@ -5,28 +5,29 @@ from sqlalchemy import text, Float
 from .core import build_select_query, build_aggregate_query
 
 
-def measure_proportion_each_column(from_clause, aggregate_func, *columns, where_clause=None):
+def measure_proportions(from_clause, aggregates, where_clause=None):
     """
     :param from_clause: used as query from clause; expected sqlalchemy TextClause, Select, Alias or Join object
-    :param aggregate_func: the sql aggregation function
-    :param columns: column names to be selected; expected str, TextClause or ColumnClause
+    :param aggregates: dict of the form {LABEL: AGGREGATE} where AGGREGATE is an aggregate function or a
+    (column, aggregate function) pair as accepted by build_aggregate_query
     :param where_clause: predicate to apply to where clause in query; expected str, TextClause, BinaryExpression
-    :return: sqlalchemy.sql.selectable.Select object
+    :return: sqlalchemy.sql.selectable.Select object with one column per label giving 1 minus the aggregate value as a
+    proportion of the number of rows
     """
     count_rows_aggregate = {"1": func.count}
-    column_aggregates = {column: aggregate_func for column in columns}
-    aggregates = {**count_rows_aggregate, **column_aggregates}
+    aggregates_ = {**count_rows_aggregate, **aggregates}
 
-    aggregate_query = build_aggregate_query(from_clause, where_clause=where_clause, **aggregates)
+    aggregate_query = build_aggregate_query(from_clause, where_clause=where_clause, **aggregates_)
     aggregate_query = aggregate_query.alias('t')
     aggregate_query_columns = list(aggregate_query.columns)
     rows_column = aggregate_query_columns[0]
-    null_cnt_columns = aggregate_query_columns[1:]
+    aggregate_columns = aggregate_query_columns[1:]
+    labels = list(aggregates)
 
     case_clauses = []
-    for i in range(len(columns)):
-        column = null_cnt_columns[i]
-        column_label = columns[i]
+    for i in range(len(labels)):
+        column = aggregate_columns[i]
+        column_label = labels[i]
         case_statement = sql.case(
             [
                 (
@@ -42,6 +43,48 @@ def measure_proportion_each_column(from_clause, aggregate_func, *columns, where_
     return measure_query
 
 
+def measure_proportion_each_column(from_clause, aggregate_func, *columns, where_clause=None):
+    """
+    :param from_clause: used as query from clause; expected sqlalchemy TextClause, Select, Alias or Join object
+    :param aggregate_func: the sql aggregation function
+    :param columns: column names to be selected; expected str, TextClause or ColumnClause
+    :param where_clause: predicate to apply to where clause in query; expected str, TextClause, BinaryExpression
+    :return: sqlalchemy.sql.selectable.Select object
+    """
+    column_aggregates = {column: aggregate_func for column in columns}
+    measure_query = measure_proportions(from_clause, column_aggregates, where_clause=where_clause)
+    return measure_query
+
+
+def format_measure_label(column, measure_name):
+    """
+    :param column: column name
+    :param measure_name: name of the measure calculated for column
+    :return: str used to label the measure value of column in a query computing several measures
+    """
+    return f"{column}_{measure_name}"
+
+
+def measure_proportions_each_column(from_clause, aggregate_funcs, *columns, where_clause=None):
+    """
+    :param from_clause: used as query from clause; expected sqlalchemy TextClause, Select, Alias or Join object
+    :param aggregate_funcs: dict of the form {MEASURE NAME: AGGREGATE FUNCTION}. every function is applied to every
+    column in a single scan of from_clause
+    :param columns: column names to be selected; expected str, TextClause or ColumnClause
+    :param where_clause: predicate to apply to where clause in query; expected str, TextClause, BinaryExpression
+    :return: sqlalchemy.sql.selectable.Select object with one column per column and measure, labeled by
+    format_measure_label
+    """
+    column_aggregates = {}
+    for column in columns:
+        for measure_name in aggregate_funcs:
+            label = format_measure_label(column, measure_name)
+            column_aggregates[label] = (column, aggregate_funcs[measure_name])
+
+    measure_query = measure_proportions(from_clause, column_aggregates, where_clause=where_clause)
+    return measure_query
+
+
 def measure_set_duplication(from_clause, *columns, where_clause=None):
     """
     :param from_clause: used as query from clause; expected sqlalchemy TextClause, Select, Alias or Join object
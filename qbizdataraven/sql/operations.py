@@ -17,10 +17,35 @@ class FetchQueryResults(object):
         return resposne
 
     def fetch_results(self, response):
-        result = self.conn.fetch(response)[0]
+        result = self.conn.fetch_one(response)
+        if result is None:
+            raise ValueError("expected query to return at least one row but found none.")
         result_columns = response.keys()
         query_results = dict(zip(result_columns, result))
         return query_results
 
     def get_results(self):
-        return self.results
\ No newline at end of file
+        return self.results
+
+
+class FetchLabeledQueryResults(FetchQueryResults):
+    def __init__(self, conn, query, label_column):
+        """
+        :param conn: Database connection object
+        :param query: SQL query where each row is identified by the value in `label_column`
+        :param label_column: name of the column holding the row label
+        """
+        self.label_column = label_column
+        super().__init__(conn, query)
+
+    def fetch_results(self, response):
+        rows = self.conn.fetch(response)
+        result_columns = response.keys()
+        query_results = {}
+        for row in rows:
+            row_results = dict(zip(result_columns, row))
+            label = row_results.pop(self.label_column)
+            # keep the first row for each label, matching FetchQueryResults
+            if label not in query_results:
+                query_results[label] = row_results
+        return query_results
@@ -1,7 +1,7 @@
 import abc
 
-from .measures import SQLNullMeasure, SQLDuplicateMeasure, SQLSetDuplicateMeasure, CSVNullMeasure, \
-    CSVDuplicateMeasure, CSVSetDuplicateMeasure
+from .measures import SQLNullMeasure, SQLDuplicateMeasure, SQLSetDuplicateMeasure, SQLNullDuplicateMeasure, \
+    CSVNullMeasure, CSVDuplicateMeasure, CSVSetDuplicateMeasure
 
 from .test_logic import test_predicate_gt
 
@@ -169,6 +169,19 @@ class SQLSetDuplicateTest(SQLTestFactory):
         return measure
 
 
+class SQLNullDuplicateTest(SQLTestFactory):
+    def __init__(self, dialect, from_, threshold, *columns, where=None, hard_fail=False, use_ansi=True):
+        description = "{column} in table {from_} should have fewer than {threshold} {measure} values."
+        predicate = test_predicate_gt
+        super().__init__(description, dialect, from_, predicate, threshold, *columns, where=where, hard_fail=hard_fail,
+                         use_ansi=use_ansi)
+
+    def build_measure(self):
+        measure = SQLNullDuplicateMeasure(self.dialect, self.from_, *self.columns, where=self.where,
+                                          use_ansi=self.use_ansi).factory()
+        return measure
+
+
 class CSVTestFactory(TestFactory):
     def __init__(self, description, from_, predicate, threshold, *columns, delimiter=',', hard_fail=False):
         """
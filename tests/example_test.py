@@ -28,9 +28,14 @@ def init_logging(logfile="example_test.log"):
     # create logger function
     logger = logging.getLogger(__name__)
 
+    for handler_ in list(logger.handlers):
+        handler_.close()
+        logger.removeHandler(handler_)
+
     # set logger level and handler
     logger.setLevel(level)
     logger.addHandler(handler)
+    logger.propagate = False
     return logger
 
 
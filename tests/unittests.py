@@ -1,21 +1,14 @@
 import unittest
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-import sqlalchemy as db
-import sqlalchemy.sql.expression as sql
-from sqlalchemy import column, text
-from sqlalchemy.sql import func
 
-from dataraven.connections import PostgresConnector, MySQLConnector
+# deletion table used to strip whitespace from queries in a single pass
+_WS_DEL = str.maketrans('', '', ' \t\n')
 
-from dataraven.sql.core import build_select_query, build_aggregate_query
-from dataraven.sql.helpers import apply_where_clause, format_from_clause, format_select_columns, compile_to_dialect
-from dataraven.sql.measure_logic import measure_proportion_each_column, measure_set_duplication
-
-from dataraven.data_quality_operators import SQLNullCheckOperator, SQLDuplicateCheckOperator, \
-    SQLSetDuplicateCheckOperator, CSVNullCheckOperator, CSVDuplicateCheckOperator, CSVSetDuplicateCheckOperator, \
-    CustomSQLDQOperator
+# sql test table
+FROM_CLAUSE = "test_schema.Orders"
 
 
 class TestHarness(object):
@@ -27,9 +20,10 @@ class TestHarness(object):
         self.dbname = os.environ["dbname"]
         self.port = os.environ["port"]
         self.dbms = os.environ["dbms"]
+        self.sa_url = self.build_sa_url()
 
         # sql test parameters
-        self.from_clause = "test_schema.Orders"
+        self.from_clause = FROM_CLAUSE
         self.conn = self.connect_database()
 
         # csv test parameters
@@ -42,7 +36,19 @@ class TestHarness(object):
         # logger function
         self.logger = self.init_logging().info
 
+    def build_sa_url(self):
+        if self.dbms.upper() == "POSTGRES":
+            return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.dbname}"
+
+        elif self.dbms.upper() == "MYSQL":
+            return f"mysql+pymysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.dbname}"
+
+        else:
+            raise ValueError(f"expected dbms to be postgres or mysql but found {self.dbms}")
+
     def connect_database(self):
+        from dataraven.connections import PostgresConnector, MySQLConnector
+
         if self.dbms.upper() == "POSTGRES":
             return PostgresConnector(self.user, self.password, self.host, self.dbname, self.port)
 
@@ -72,132 +78,247 @@ class TestHarness(object):
         # create logger function
         logger = logging.getLogger(__name__)
 
+        # replace handlers from any previous call so each record is only written once
+        TestHarness.remove_handlers(logger)
+
         # set logger level and handler
         logger.setLevel(level)
         logger.addHandler(handler)
+        logger.propagate = False
         return logger
 
+    @staticmethod
+    def remove_handlers(logger):
+        # close and detach every handler attached to logger
+        for handler in list(logger.handlers):
+            handler.close()
+            logger.removeHandler(handler)
+
+    def close(self):
+        # release the database connection and log file opened by the harness
+        if self.conn.conn is not None:
+            self.conn.conn.close()
+            # closing the connection only returns it to the pool; dispose the engine to close the socket
+            self.conn.conn.engine.dispose()
+
+        logger = logging.getLogger(__name__)
+        self.remove_handlers(logger)
+
     @staticmethod
     def strip_all_space(target):
         if not isinstance(target, str):
             target = str(target)
-        target_ = target.replace('\n', '').replace('\t', '').replace(' ', '')
+        target_ = target.translate(_WS_DEL)
         return target_
 
 
-th = TestHarness()
+# expected queries. whitespace is stripped once at import rather than in every test
+SELECT_QUERY1_TARGET = TestHarness.strip_all_space(f"""
+    SELECT col1, col2
+    FROM {FROM_CLAUSE}
+    """).lower()
+
+SELECT_QUERY2_TARGET = TestHarness.strip_all_space(f"""
+    SELECT col1, col2
+    FROM {FROM_CLAUSE}
+    WHERE col3 > 0
+    """).lower()
+
+SELECT_QUERY3_TARGET = TestHarness.strip_all_space(f"""
+    SELECT col1, col2
+    FROM {FROM_CLAUSE}
+    WHERE col3 > 0 AND col4 like 'A%'
+    """).lower()
+
+AGGREGATE_QUERY_TARGET = TestHarness.strip_all_space(f"""
+    SELECT col1, col2, count(col3) AS col3
+    FROM {FROM_CLAUSE}
+    GROUP BY col1, col2
+    """).lower()
+
+WHERE_CLAUSE_QUERY_TARGET = TestHarness.strip_all_space(f"""
+    SELECT col1, col2
+    FROM {FROM_CLAUSE}
+    WHERE col2 > 0
+    """).lower()
+
+COMPILE_TO_DIALECT_QUERY_TARGET = TestHarness.strip_all_space(f"""
+    SELECT col1, col2
+    FROM {FROM_CLAUSE}
+    """).lower()
+
+UNION_LABELED_QUERIES_TARGET = TestHarness.strip_all_space(f"""
+    select 'col1' as label, q0.* from (select count(col1) as measure from {FROM_CLAUSE}) q0
+    union all
+    select 'o''col' as label, q1.* from (select count(col2) as measure from {FROM_CLAUSE}) q1
+    """).lower()
+
+MEASURE_PROPORTION_QUERY_TARGET = TestHarness.strip_all_space(f"""
+    SELECT 
+    CASE 
+        WHEN (t."1" > 0) THEN 1 - CAST(t.col1 AS FLOAT) / t."1" 
+    END AS col1, 
+    CASE 
+        WHEN (t."1" > 0) THEN 1 - CAST(t.col2 AS FLOAT) / t."1" 
+    END AS col2
+    FROM (SELECT count(1) AS "1", count(col1) AS col1, count(col2) AS col2
+    FROM {FROM_CLAUSE}) AS t
+    """).lower()
+
+MEASURE_PROPORTIONS_QUERY_TARGET = TestHarness.strip_all_space(f"""
+    SELECT 
+    CASE 
+        WHEN (t."1" > 0) THEN 1 - CAST(t.col1_null AS FLOAT) / t."1" 
+    END AS col1_null, 
+    CASE 
+        WHEN (t."1" > 0) THEN 1 - CAST(t.col1_duplicate AS FLOAT) / t."1" 
+    END AS col1_duplicate, 
+    CASE 
+        WHEN (t."1" > 0) THEN 1 - CAST(t.col2_null AS FLOAT) / t."1" 
+    END AS col2_null, 
+    CASE 
+        WHEN (t."1" > 0) THEN 1 - CAST(t.col2_duplicate AS FLOAT) / t."1" 
+    END AS col2_duplicate
+    FROM (SELECT count(1) AS "1", count(col1) AS col1_null, count(DISTINCT col1) AS col1_duplicate, 
+    count(col2) AS col2_null, count(DISTINCT col2) AS col2_duplicate
+    FROM {FROM_CLAUSE}) AS t
+    """).lower()
+
+MEASURE_SET_DUPLICATION_QUERY_TARGET = TestHarness.strip_all_space(f"""
+    SELECT CASE WHEN (r."1" > 0) THEN 1 - CAST(u."1" AS FLOAT) / r."1" END AS "col1,col2"
+    FROM (SELECT count(1) AS "1"
+    FROM {FROM_CLAUSE}) AS r JOIN (SELECT count(1) AS "1"
+    FROM (SELECT DISTINCT col1, col2
+    FROM {FROM_CLAUSE}) AS t) AS u ON r."1" IS NOT NULL
+    """).lower()
+
+
+# shared test harness. created in setUpModule so that importing or collecting this module does not open a database
+# connection or touch the log file
+th = None
+
+
+def setUpModule():
+    global th
+    th = TestHarness()
+
+
+def tearDownModule():
+    global th
+    th.close()
+    th = None
 
 
 class TestDBConnector(unittest.TestCase):
-    def test_execute(self):
-        if th.dbms.upper() == "POSTGRES":
-            cred = f"postgresql://{th.user}:{th.password}@{th.host}:{th.port}/{th.dbname}"
-        elif th.dbms.upper() == "MYSQL":
-            cred = f"mysql+pymysql://{th.user}:{th.password}@{th.host}:{th.port}/{th.dbname}"
-        else:
-            raise ValueError(f"expected dbms to be postgres or mysql but found {th.dbms}")
+    @classmethod
+    def setUpClass(cls):
+        import sqlalchemy as db
 
-        engine = db.create_engine(cred)
-        sa_conn = engine.connect()
+        cls.engine = db.create_engine(th.sa_url, pool_pre_ping=False, pool_size=1)
+        cls.sa_conn = cls.engine.connect()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sa_conn.close()
+        cls.engine.dispose()
+
+    @staticmethod
+    def _run_pair(result_fn, target_fn):
+        # the two queries use independent connections so run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result_future = executor.submit(result_fn)
+            target_future = executor.submit(target_fn)
+            return result_future.result(), target_future.result()
+
+    def test_execute(self):
         query = f"select * from {th.from_clause} order by 1 limit 1"
-        target = sa_conn.execute(query).fetchall()[0]
-        result = th.conn.execute(query).fetchall()[0]
+        result, target = self._run_pair(lambda: th.conn.execute(query).fetchone(),
+                                        lambda: self.sa_conn.execute(query).fetchone())
         self.assertEqual(result, target)
 
     def test_fetch(self):
-        if th.dbms.upper() == "POSTGRES":
-            cred = f"postgresql://{th.user}:{th.password}@{th.host}:{th.port}/{th.dbname}"
-        elif th.dbms.upper() == "MYSQL":
-            cred = f"mysql+pymysql://{th.user}:{th.password}@{th.host}:{th.port}/{th.dbname}"
-        else:
-            raise ValueError(f"expected dbms to be postgres or mysql but found {th.dbms}")
+        query = f"select * from {th.from_clause} order by 1 limit 1"
+        result, target = self._run_pair(lambda: th.conn.fetch(th.conn.execute(query))[0],
+                                        lambda: self.sa_conn.execute(query).fetchone())
+        self.assertEqual(result, target)
+
+    def test_fetch_batches(self):
+        query = f"select * from {th.from_clause} order by 1"
+
+        def fetch_streamed():
+            response = th.conn.execute(query, stream_results=True)
+            return [row for batch in th.conn.fetch_batches(response, batch_size=100) for row in batch]
 
-        engine = db.create_engine(cred)
-        sa_conn = engine.connect()
+        result, target = self._run_pair(fetch_streamed, lambda: self.sa_conn.execute(query).fetchall())
+        self.assertEqual(result, target)
+
+    def test_fetch_one(self):
         query = f"select * from {th.from_clause} order by 1 limit 1"
-        response = th.conn.execute(query)
-        result = th.conn.fetch(response)[0]
-        target = sa_conn.execute(query).fetchall()[0]
+        result, target = self._run_pair(lambda: th.conn.fetch_one(th.conn.execute(query)),
+                                        lambda: self.sa_conn.execute(query).fetchone())
         self.assertEqual(result, target)
 
 
 class TestSQLCore(unittest.TestCase):
     def test_build_sql_query(self):
+        from sqlalchemy import column, text
+        from dataraven.sql.core import build_select_query
+
         columns = ("col1", "col2")
 
         query1 = build_select_query(th.from_clause, *columns)
         query1_ = th.strip_all_space(query1).lower()
-        query1_target = f"""
-        SELECT col1, col2
-        FROM {th.from_clause}
-        """.lower()
-        query1_target_ = th.strip_all_space(query1_target)
-        self.assertEqual(query1_, query1_target_)
+        self.assertEqual(query1_, SELECT_QUERY1_TARGET)
 
         where_clause2 = column("col3") > text("0")
         query2 = build_select_query(th.from_clause, *columns, where_clause=where_clause2)
         query2_ = th.strip_all_space(query2).lower()
-        query2_target = f"""
-        SELECT col1, col2
-        FROM {th.from_clause}
-        WHERE col3 > 0
-        """.lower()
-        query2_target_ = th.strip_all_space(query2_target)
-        self.assertEqual(query2_, query2_target_)
+        self.assertEqual(query2_, SELECT_QUERY2_TARGET)
 
         where_clause3 = [where_clause2, "col4 like 'A%'"]
         query3 = build_select_query(th.from_clause, *columns, where_clause=where_clause3)
         query3_ = th.strip_all_space(query3).lower()
-        query3_target = f"""
-        SELECT col1, col2
-        FROM {th.from_clause}
-        WHERE col3 > 0 AND col4 like 'A%'
-        """.lower()
-        query3_target_ = th.strip_all_space(query3_target)
-        self.assertEqual(query3_, query3_target_)
+        self.assertEqual(query3_, SELECT_QUERY3_TARGET)
 
     def test_build_aggregate_query(self):
+        from sqlalchemy.sql import func
+        from dataraven.sql.core import build_aggregate_query
+
         columns = ("col1", "col2")
         query1 = build_aggregate_query(th.from_clause, *columns, col3=func.count)
         query1_ = th.strip_all_space(query1).lower()
-        query1_target = f"""
-        SELECT col1, col2, count(col3) AS col3
-        FROM {th.from_clause}
-        GROUP BY col1, col2
-        """.lower()
-        query1_target_ = th.strip_all_space(query1_target)
-        self.assertEqual(query1_, query1_target_)
+        self.assertEqual(query1_, AGGREGATE_QUERY_TARGET)
 
 
 class TestSQLHelpers(unittest.TestCase):
     def test_apply_where_clause(self):
+        import sqlalchemy.sql.expression as sql
+        from sqlalchemy import column, text
+        from dataraven.sql.helpers import apply_where_clause
+
         columns = ("col1", "col2")
         columns_ = list(map(lambda col: text(col), columns))
         query = sql.select(columns_).select_from(text(th.from_clause))
 
-        query_target_ = f"""
-        SELECT col1, col2
-        FROM {th.from_clause}
-        WHERE col2 > 0
-        """.lower()
-        query_target = th.strip_all_space(query_target_)
-
         where_clause1 = "col2 > 0"
         query1 = apply_where_clause(query, where_clause1)
         query1_ = th.strip_all_space(query1).lower()
-        self.assertEqual(query1_, query_target)
+        self.assertEqual(query1_, WHERE_CLAUSE_QUERY_TARGET)
 
         where_clause2 = text(where_clause1)
         query2 = apply_where_clause(query, where_clause2)
         query2_ = th.strip_all_space(query2).lower()
-        self.assertEqual(query2_, query_target)
+        self.assertEqual(query2_, WHERE_CLAUSE_QUERY_TARGET)
 
         where_clause3 = column("col2") > text("0")
         query3 = apply_where_clause(query, where_clause3)
         query3_ = th.strip_all_space(query3).lower()
-        self.assertEqual(query3_, query_target)
+        self.assertEqual(query3_, WHERE_CLAUSE_QUERY_TARGET)
 
     def test_format_from_clause(self):
+        from sqlalchemy import text
+        from dataraven.sql.helpers import format_from_clause
+
         from_clause1 = th.from_clause
         from_clause1_ = format_from_clause(from_clause1)
         self.assertEqual(from_clause1_.__class__.__name__, "TextClause")
@@ -208,7 +329,13 @@ class TestSQLHelpers(unittest.TestCase):
         self.assertEqual(from_clause2_.__class__.__name__, "TextClause")
         self.assertEqual(str(from_clause2_), th.from_clause)
 
+        from_clause3_ = format_from_clause(from_clause1)
+        self.assertIs(from_clause3_, from_clause1_)
+
     def test_format_select_columns(self):
+        from sqlalchemy import column, text
+        from dataraven.sql.helpers import format_select_columns
+
         columns1 = ("col1", "col2")
         columns1_ = format_select_columns(*columns1)
         self.assertTrue(all(map(lambda col: type(col).__name__ == "ColumnClause", columns1_)))
@@ -221,54 +348,81 @@ class TestSQLHelpers(unittest.TestCase):
         columns3_ = format_select_columns(*columns3)
         self.assertTrue(all(map(lambda col: type(col).__name__ == "ColumnClause", columns3_)))
 
+        columns4_ = format_select_columns(*columns1)
+        self.assertTrue(all(map(lambda cols: cols[0] is cols[1], zip(columns4_, columns1_))))
+
     def test_compile_to_dialect(self):
+        import sqlalchemy.sql.expression as sql
+        from sqlalchemy import text
+        from dataraven.sql.helpers import compile_to_dialect
+
         columns = (text("col1"), text("col2"))
         query = sql.select(columns).select_from(text(th.from_clause))
         postgres_query = compile_to_dialect(query, "postgres")
         postgres_query_ = th.strip_all_space(postgres_query).lower()
-        query_target_ = f"""
-        SELECT col1, col2
-        FROM {th.from_clause}
-        """.lower()
-        query_target = th.strip_all_space(query_target_)
-        self.assertEqual(postgres_query_, query_target)
+        self.assertEqual(postgres_query_, COMPILE_TO_DIALECT_QUERY_TARGET)
+
+    def test_union_labeled_queries(self):
+        from dataraven.sql.helpers import union_labeled_queries
+
+        labeled_queries = (("col1", f"select count(col1) as measure from {th.from_clause};"),
+                           ("o'col", f"select count(col2) as measure from {th.from_clause}"))
+        query = union_labeled_queries(labeled_queries, "label")
+        query_ = th.strip_all_space(query).lower()
+        self.assertEqual(query_, UNION_LABELED_QUERIES_TARGET)
+
+    def test_union_labeled_queries_trailing_comment(self):
+        from dataraven.sql.helpers import union_labeled_queries
+
+        labeled_queries = (("col1", f"select count(col1) as measure from {th.from_clause} -- count col1"),)
+        query = union_labeled_queries(labeled_queries, "label")
+        query_lines = query.split("\n")
+        self.assertEqual(query_lines[-2].strip(), f"select count(col1) as measure from {th.from_clause} -- count col1")
+        self.assertEqual(query_lines[-1], ") q0")
+
+    def test_union_labeled_queries_trailing_semicolon_comment(self):
+        from dataraven.sql.helpers import union_labeled_queries
+
+        labeled_queries = (("col1", f"select count(col1) as measure from {th.from_clause}; -- count col1"),
+                           ("col2", f"select count(col2) as measure from {th.from_clause}; /* count col2 */"))
+        query = union_labeled_queries(labeled_queries, "label")
+        query_lines = query.split("\n")
+        self.assertEqual(query_lines[1].strip(), f"select count(col1) as measure from {th.from_clause} -- count col1")
+        self.assertEqual(query_lines[2], ") q0")
+        self.assertEqual(query_lines[5].strip(), f"select count(col2) as measure from {th.from_clause} /* count col2 */")
+        self.assertEqual(query_lines[6], ") q1")
 
 
 class TestSQLMeasureLogic(unittest.TestCase):
     maxDiff = None
     def test_measure_proportion_each_column(self):
+        from sqlalchemy.sql import func
+        from dataraven.sql.measure_logic import measure_proportion_each_column
+
         aggregate_func = func.count
         columns = ("col1", "col2")
         query = measure_proportion_each_column(th.from_clause, aggregate_func, *columns)
         query_ = th.strip_all_space(query).lower()
-        query1_target = f"""
-        SELECT 
-        CASE 
-            WHEN (t."1" > 0) THEN 1 - CAST(t.col1 AS FLOAT) / t."1" 
-        END AS col1, 
-        CASE 
-            WHEN (t."1" > 0) THEN 1 - CAST(t.col2 AS FLOAT) / t."1" 
-        END AS col2
-        FROM (SELECT count(1) AS "1", count(col1) AS col1, count(col2) AS col2
-        FROM {th.from_clause}) AS t
-        """.lower()
-        query1_target_ = th.strip_all_space(query1_target)
-        self.assertEqual(query_, query1_target_)
+        self.assertEqual(query_, MEASURE_PROPORTION_QUERY_TARGET)
+
+    def test_measure_proportions_each_column(self):
+        from sqlalchemy.sql import func, distinct
+        from dataraven.sql.measure_logic import measure_proportions_each_column
+
+        aggregate_funcs = {"null": func.count, "duplicate": lambda col: func.count(distinct(col))}
+        columns = ("col1", "col2")
+        query = measure_proportions_each_column(th.from_clause, aggregate_funcs, *columns)
+        query_ = th.strip_all_space(query).lower()
+        self.assertEqual(query_, MEASURE_PROPORTIONS_QUERY_TARGET)
 
     def test_measure_set_duplication(self):
+        from dataraven.sql.measure_logic import measure_set_duplication
+
         from_clause = th.from_clause
         columns = ("col1", "col2")
         query = measure_set_duplication(from_clause, *columns)
         query_ = th.strip_all_space(query).lower()
-        query_target = f"""
-        SELECT CASE WHEN (r."1" > 0) THEN 1 - CAST(u."1" AS FLOAT) / r."1" END AS "col1,col2"
-        FROM (SELECT count(1) AS "1"
-        FROM {th.from_clause}) AS r JOIN (SELECT count(1) AS "1"
-        FROM (SELECT DISTINCT col1, col2
-        FROM {th.from_clause}) AS t) AS u ON r."1" IS NOT NULL
-        """.lower()
-        query_target_ = th.strip_all_space(query_target)
-        self.assertEqual(query_, query_target_)
+        self.assertEqual(query_, MEASURE_SET_DUPLICATION_QUERY_TARGET)
 
 
 class TestFetchQueryResults(unittest.TestCase):
@@ -370,6 +524,8 @@ class TestCustomTestFactory(unittest.TestCase):
 
 class TestDataQualityOperators(unittest.TestCase):
     def test_SQLNullCheckOperator(self):
+        from dataraven.data_quality_operators import SQLNullCheckOperator
+
         results = SQLNullCheckOperator(th.conn, th.from_clause, th.threshold, *th.columns, logger=th.logger)\
             .test_results
 
@@ -390,6 +546,8 @@ class TestDataQualityOperators(unittest.TestCase):
         self.assertEqual(outcome_columns, target_outcome_columns)
 
     def test_SQLDuplicateCheckOperator(self):
+        from dataraven.data_quality_operators import SQLDuplicateCheckOperator
+
         results = SQLDuplicateCheckOperator(th.conn, th.from_clause, th.threshold, *th.columns, logger=th.logger)\
             .test_results
 
@@ -410,6 +568,8 @@ class TestDataQualityOperators(unittest.TestCase):
         self.assertEqual(outcome_columns, target_outcome_columns)
 
     def test_SQLSetDuplicateCheckOperator(self):
+        from dataraven.data_quality_operators import SQLSetDuplicateCheckOperator
+
         threshold_ = 0.1
         results = SQLSetDuplicateCheckOperator(th.conn, th.from_clause, threshold_, *th.columns, logger=th.logger)\
             .test_results
@@ -427,7 +587,29 @@ class TestDataQualityOperators(unittest.TestCase):
         num_outcomes = len(results)
         self.assertEqual(num_outcomes, 1)
 
+    def test_SQLNullDuplicateCheckOperator(self):
+        from dataraven.data_quality_operators import SQLNullDuplicateCheckOperator
+
+        threshold_ = 0
+        results = SQLNullDuplicateCheckOperator(th.conn, th.from_clause, threshold_, *th.columns, logger=th.logger)\
+            .test_results
+
+        null_result = results["order_ts_null"]
+        self.assertEqual(null_result["result"], "test_pass")
+        self.assertEqual(null_result["measure"], 0)
+        self.assertEqual(null_result["threshold"], threshold_)
+
+        duplicate_result = results["order_ts_duplicate"]
+        self.assertEqual(duplicate_result["result"], "test_fail")
+        self.assertEqual(duplicate_result["measure"], 0.366)
+        self.assertEqual(duplicate_result["threshold"], threshold_)
+
+        num_outcomes = len(results)
+        self.assertEqual(num_outcomes, 6)
+
     def test_CSVNullCheckOperator(self):
+        from dataraven.data_quality_operators import CSVNullCheckOperator
+
         results = CSVNullCheckOperator(th.path, th.threshold, *th.columns, logger=th.logger).test_results
 
         orders_ts_result = results["order_ts"]
@@ -447,6 +629,8 @@ class TestDataQualityOperators(unittest.TestCase):
         self.assertEqual(outcome_columns, target_outcome_columns)
 
     def test_CSVDuplicateCheckOperator(self):
+        from dataraven.data_quality_operators import CSVDuplicateCheckOperator
+
         results = CSVDuplicateCheckOperator(th.path, th.threshold, *th.columns, logger=th.logger).test_results
 
         orders_ts_result = results["order_ts"]
@@ -467,6 +651,8 @@ class TestDataQualityOperators(unittest.TestCase):
         self.assertEqual(outcome_columns, target_outcome_columns)
 
     def test_CSVSetDuplicateCheckOperator(self):
+        from dataraven.data_quality_operators import CSVSetDuplicateCheckOperator
+
         threshold_ = 0.1
         results = CSVSetDuplicateCheckOperator(th.path, threshold_, *th.columns, logger=th.logger).test_results
 
@@ -484,6 +670,8 @@ class TestDataQualityOperators(unittest.TestCase):
         self.assertEqual(num_outcomes, 1)
 
     def test_CustomSQLDQOperator(self):
+        from dataraven.data_quality_operators import CustomSQLDQOperator
+
         description1 = "{column} in table test_schema.Orders should not have more than 0.1 duplicate values"
         query1 = """
         select
@@ -522,7 +710,45 @@ class TestDataQualityOperators(unittest.TestCase):
         target_outcome_columns = list(th.columns).sort()
         self.assertEqual(outcome_columns, target_outcome_columns)
 
+    def test_CustomSQLDQOperator_column_without_rows(self):
+        from dataraven.data_quality_operators import CustomSQLDQOperator
+
+        description = "{column} in table test_schema.Orders should return a test result"
+        query = """
+        select 'test_pass' as result, 0 as measure, {threshold} as threshold
+        from test_schema.Orders
+        where '{column}' <> 'price'
+        limit 1
+        """
+        with self.assertRaises(ValueError):
+            CustomSQLDQOperator(th.conn, query, description, *th.columns, threshold=th.threshold, logger=th.logger)
+
+    def test_CustomSQLDQOperator_column_with_multiple_rows(self):
+        from dataraven.data_quality_operators import CustomSQLDQOperator
+
+        description = "{column} in table test_schema.Orders should return a test result"
+        query = """
+        select result, measure, {threshold} as threshold
+        from
+        (select 'test_pass' as result, 1 as measure
+        union all
+        select 'test_fail' as result, 2 as measure)t
+        order by measure
+        limit 2
+        """
+        results = CustomSQLDQOperator(th.conn, query, description, *th.columns, threshold=th.threshold,
+                                      logger=th.logger).test_results
+
+        num_outcomes = len(results)
+        self.assertEqual(num_outcomes, 3)
+
+        for column in th.columns:
+            self.assertEqual(results[column]["result"], "test_pass")
+            self.assertEqual(results[column]["measure"], 1)
+
     def test_CustomSQLDQOperator_no_columns(self):
+        from dataraven.data_quality_operators import CustomSQLDQOperator
+
         description = "product_id in table test_schema.Orders should not have more than 0.1 duplicate values"
         query = """
         select